@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 
-import struct, io, binascii, itertools, collections, pickle, sys, os, tempfile, hashlib, importlib
+import struct, io, binascii, itertools, collections, pickle, sys, os, tempfile, hashlib, importlib, threading
 
 from construct.lib import *
 from construct.expr import *
@@ -193,6 +193,27 @@ def extractfield(sc):
     return sc
 
 
+def staticsizeof(sc, building=False):
+    """Used internally. Returns size of a field whose size cannot depend on context, or None if it might. When building, Sequence is not static, because it builds as many members as the given list has."""
+    if type(sc) is Renamed:
+        return staticsizeof(sc.subcon, building)
+    if type(sc) is FormatField:
+        return sc.length
+    if type(sc) is Bytes and isinstance(sc.length, int):
+        return sc.length
+    if type(sc) is Array and isinstance(sc.count, int) and sc.count >= 0:
+        size = staticsizeof(sc.subcon, building)
+        return None if size is None else sc.count * size
+    if building and type(sc) is Sequence:
+        return None
+    if building and type(sc) is Struct:
+        sizes = [staticsizeof(member, building) for member in sc.subcons]
+        return None if None in sizes else sum(sizes)
+    if type(sc) in (Struct, Sequence):
+        return sc._staticsize
+    return None
+
+
 def evaluate(param, context):
     return param(context) if callable(param) else param
 
@@ -248,19 +269,7 @@ class Construct(object):
         return "<%s%s%s%s>" % (self.__class__.__name__, " "+self.name if self.name else "", " +nonbuild" if self.flagbuildnone else "", " +docs" if self.docs else "", )
 
     def __getstate__(self):
-        attrs = {}
-        if hasattr(self, "__dict__"):
-            attrs.update(self.__dict__)
-        slots = []
-        c = self.__class__
-        while c is not None:
-            if hasattr(c, "__slots__"):
-                slots.extend(c.__slots__)
-            c = c.__base__
-        for name in slots:
-            if hasattr(self, name):
-                attrs[name] = getattr(self, name)
-        return attrs
+        return dict(self.__dict__)
 
     def __setstate__(self, attrs):
         for name, value in attrs.items():
@@ -268,7 +277,7 @@ class Construct(object):
 
     def __copy__(self):
         self2 = object.__new__(self.__class__)
-        self2.__setstate__(self, self.__getstate__())
+        self2.__setstate__(self.__getstate__())
         return self2
 
     def parse(self, data, **contextkw):
@@ -290,6 +299,8 @@ class Construct(object):
     def parse_stream(self, stream, **contextkw):
         r"""
         Parse a stream. Files, pipes, sockets, and other streaming sources of data are handled by this method. See parse().
+
+        Many fields read only few bytes at a time, so pass buffered streams (like files opened with `open(filename, 'rb')`, the default buffering). Unbuffered raw streams (`buffering=0`, raw sockets) make a system call for every such read. The stream is used as given, so its position after parsing is exactly after the parsed data.
         """
         context = Container(**contextkw)
         context._parsing = True
@@ -339,6 +350,8 @@ class Construct(object):
     def build_stream(self, obj, stream, **contextkw):
         r"""
         Build an object directly into a stream. See build().
+
+        Many fields write only few bytes at a time, so pass buffered streams (like files opened with `open(filename, 'wb')`, the default buffering). Unbuffered raw streams make a system call for every such write.
         """
         context = Container(**contextkw)
         context._parsing = False
@@ -747,17 +760,31 @@ class Tunnel(Subconstruct):
     """
     def _parse(self, stream, context, path):
         data = stream_read_entire(stream, path)  # reads entire stream
+        return self._parsedata(data, context, path)
+
+    def _parsedata(self, data, context, path):
         data = self._decode(data, context, path)
+        if self.subcon is GreedyBytes:
+            return data
         return self.subcon.parse(data, **context)
 
     def _build(self, obj, stream, context, path):
-        stream2 = io.BytesIO()
-        buildret = self.subcon._build(obj, stream2, context, path)
-        data = stream2.getvalue()
-        data = self._encode(data, context, path)
+        data = self._builddata(obj, context, path)
         stream_write(stream, data, len(data), path)
         return obj
 
+    def _builddata(self, obj, context, path):
+        if self.subcon is GreedyBytes:
+            # the payload is the object itself, no need to build it into a temporary stream
+            data = bytes(obj) if type(obj) is bytearray else obj
+            if not isinstance(data, bytestringtype):
+                raise StringError("given non-bytes value, perhaps unicode? %r" % (data,), path=path)
+        else:
+            stream2 = io.BytesIO()
+            self.subcon._build(obj, stream2, context, path)
+            data = stream2.getvalue()
+        return self._encode(data, context, path)
+
     def _sizeof(self, context, path):
         raise SizeofError(path=path)
 
@@ -843,7 +870,13 @@ class Bytes(Construct):
 
     def _build(self, obj, stream, context, path):
         length = self.length(context) if callable(self.length) else self.length
-        data = integer2bytes(obj, length) if isinstance(obj, int) else obj
+        if isinstance(obj, int):
+            try:
+                data = integer2bytes(obj, length)
+            except OverflowError:
+                raise IntegerError("value %r does not fit in %d bytes" % (obj, length), path=path)
+        else:
+            data = obj
         data = bytes(data) if type(data) is bytearray else data
         stream_write(stream, data, length, path)
         return data
@@ -979,6 +1012,16 @@ def Bytewise(subcon):
 #===============================================================================
 # integers and floats
 #===============================================================================
+_packer_cache = {}
+
+def _getpacker(fmtstr):
+    """Used internally. Returns a struct.Struct shared by all FormatFields of same format string."""
+    packer = _packer_cache.get(fmtstr)
+    if packer is None:
+        packer = _packer_cache.setdefault(fmtstr, struct.Struct(fmtstr))
+    return packer
+
+
 class FormatField(Construct):
     r"""
     Field that uses `struct` module to pack and unpack CPU-sized integers and floats. This is used to implement most Int* Float* fields, but for example cannot pack 24-bit integers, which is left to :class:`~construct.core.BytesInteger` class.
@@ -1013,19 +1056,25 @@ class FormatField(Construct):
 
         super(FormatField, self).__init__()
         self.fmtstr = endianity+format
-        self.length = struct.calcsize(endianity+format)
-        self.packer = struct.Struct(endianity+format)
+        self.packer = _getpacker(endianity+format)
+        self.length = self.packer.size
+        self._pack = self.packer.pack
+        self._unpack = self.packer.unpack
 
     def _parse(self, stream, context, path):
-        data = stream_read(stream, self.length, path)
+        # same as stream_read, inlined, length is known to be non-negative
+        length = self.length
         try:
-            return self.packer.unpack(data)[0]
+            data = stream.read(length)
         except Exception:
-            raise FormatFieldError("struct %r error during parsing" % self.fmtstr, path=path)
+            raise StreamError("stream.read() failed, requested %s bytes" % (length,), path=path)
+        if len(data) != length:
+            raise StreamError("stream read less than specified amount, expected %d, found %d" % (length, len(data)), path=path)
+        return self._unpack(data)[0]
 
     def _build(self, obj, stream, context, path):
         try:
-            data = self.packer.pack(obj)
+            data = self._pack(obj)
         except Exception:
             raise FormatFieldError("struct %r error during building, given value %r" % (self.fmtstr, obj), path=path)
         stream_write(stream, data, self.length, path)
@@ -1110,7 +1159,10 @@ class BytesInteger(Construct):
             length = length(context)
         if length < 0:
             raise IntegerError("length must be non-negative", path=path)
-        data = integer2bytes(obj, length)
+        try:
+            data = integer2bytes(obj, length)
+        except OverflowError:
+            raise IntegerError("value %r does not fit in %d bytes" % (obj, length), path=path)
         if self.swapped:
             data = data[::-1]
         stream_write(stream, data, length, path)
@@ -1434,16 +1486,14 @@ class VarInt(Construct):
     """
 
     def _parse(self, stream, context, path):
-        acc = []
+        num = 0
+        shift = 0
         while True:
-            b = byte2int(stream_read(stream, 1, path))
-            acc.append(b & 0b01111111)
+            b = stream_read(stream, 1, path)[0]
+            num |= (b & 0b01111111) << shift
             if not b & 0b10000000:
-                break
-        num = 0
-        for b in reversed(acc):
-            num = (num << 7) | b
-        return num
+                return num
+            shift += 7
 
     def _build(self, obj, stream, context, path):
         if not isinstance(obj, integertypes):
@@ -1451,10 +1501,12 @@ class VarInt(Construct):
         if obj < 0:
             raise IntegerError("varint cannot build from negative number: %r" % (obj,), path=path)
         x = obj
+        data = bytearray()
         while x > 0b01111111:
-            stream_write(stream, int2byte(0b10000000 | (x & 0b01111111)), 1, path)
+            data.append(0b10000000 | (x & 0b01111111))
             x >>= 7
-        stream_write(stream, int2byte(x), 1, path)
+        data.append(x)
+        stream_write(stream, bytes(data), len(data), path)
         return obj
 
     def _emitprimitivetype(self, ksy, bitwise):
@@ -1902,6 +1954,85 @@ class Mapping(Adapter):
 #===============================================================================
 # structures and sequences
 #===============================================================================
+class FormatFieldRun(object):
+    """Used internally. Consecutive plain FormatField members of a Struct or Sequence that share endianity, processed with a single struct call."""
+
+    def __init__(self, subcons):
+        fields = [extractfield(sc) for sc in subcons]
+        self.subcons = subcons
+        self.names = [sc.name for sc in subcons]
+        self.ends = list(itertools.accumulate(f.length for f in fields))
+        self.packer = _getpacker(fields[0].fmtstr[0] + "".join(f.fmtstr[1] for f in fields))
+
+    @staticmethod
+    def fusable(sc):
+        if type(sc) is Renamed:
+            if sc.parsed is not None:
+                return False
+            sc = sc.subcon
+        return type(sc) is FormatField and sc.parsed is None
+
+    @classmethod
+    def fuse(cls, subcons):
+        """Returns subcons list where runs of 2 or more fusable FormatFields (of same endianity) are replaced by FormatFieldRun instances."""
+        result = []
+        run = []
+        def flush():
+            if len(run) >= 2:
+                result.append(cls(list(run)))
+            else:
+                result.extend(run)
+            del run[:]
+        for sc in subcons:
+            if not cls.fusable(sc):
+                flush()
+                result.append(sc)
+                continue
+            if run and extractfield(run[0]).fmtstr[0] != extractfield(sc).fmtstr[0]:
+                flush()
+            run.append(sc)
+        flush()
+        return result
+
+    def _parsevalues(self, stream, path):
+        length = self.packer.size
+        try:
+            data = stream.read(length)
+        except Exception:
+            raise StreamError("stream.read() failed, requested %s bytes" % (length,), path=path)
+        if len(data) != length:
+            # report the member that ran out of data, like an unfused Struct would
+            found = len(data)
+            start = 0
+            for sc,end in zip(self.subcons, self.ends):
+                if end > found:
+                    if type(sc) is Renamed:
+                        path += " -> %s" % (sc.name,)
+                    raise StreamError("stream read less than specified amount, expected %d, found %d" % (end-start, found-start), path=path)
+                start = end
+        return self.packer.unpack(data)
+
+    def _buildfrom(self, obj, stream, context, path):
+        try:
+            values = [obj[name] for name in self.names]
+            data = self.packer.pack(*values)
+        except Exception:
+            # build members one by one like an unfused Struct, so the first offending member raises its own error
+            for sc in self.subcons:
+                name = sc.name
+                subobj = obj[name] # raises KeyError
+                if name:
+                    context[name] = subobj
+                buildret = sc._build(subobj, stream, context, path)
+                if name:
+                    context[name] = buildret
+            return
+        stream_write(stream, data, self.packer.size, path)
+        for name,value in zip(self.names, values):
+            if name:
+                context[name] = value
+
+
 class Struct(Construct):
     r"""
     Sequence of usually named constructs, similar to structs in C. The members are parsed and build in the order they are defined. If a member is anonymous (its name is None) then it gets parsed and the value discarded, or it gets build from nothing (from None).
@@ -1965,6 +2096,10 @@ class Struct(Construct):
         super(Struct, self).__init__()
         self.subcons = list(subcons) + list(k/v for k,v in subconskw.items())
         self._subcons = Container((sc.name,sc) for sc in self.subcons if sc.name)
+        # anonymous Pass members do nothing when parsing or building, leave them out of the loops
+        self._fusedsubcons = FormatFieldRun.fuse([sc for sc in self.subcons if sc is not Pass])
+        sizes = [staticsizeof(sc) for sc in self.subcons]
+        self._staticsize = None if None in sizes else sum(sizes)
         self.flagbuildnone = all(sc.flagbuildnone for sc in self.subcons)
 
     def __getattr__(self, name):
@@ -1977,7 +2112,13 @@ class Struct(Construct):
         obj._io = stream
         context = Container(_ = context, _params = context._params, _root = None, _parsing = context._parsing, _building = context._building, _sizing = context._sizing, _subcons = self._subcons, _io = stream, _index = context.get("_index", None))
         context._root = context._.get("_root", context)
-        for sc in self.subcons:
+        for sc in self._fusedsubcons:
+            if type(sc) is FormatFieldRun:
+                for name,value in zip(sc.names, sc._parsevalues(stream, path)):
+                    if name:
+                        obj[name] = value
+                        context[name] = value
+                continue
             try:
                 subobj = sc._parsereport(stream, context, path)
                 if sc.name:
@@ -1993,24 +2134,30 @@ class Struct(Construct):
         context = Container(_ = context, _params = context._params, _root = None, _parsing = context._parsing, _building = context._building, _sizing = context._sizing, _subcons = self._subcons, _io = stream, _index = context.get("_index", None))
         context._root = context._.get("_root", context)
         context.update(obj)
-        for sc in self.subcons:
+        for sc in self._fusedsubcons:
+            if type(sc) is FormatFieldRun:
+                sc._buildfrom(obj, stream, context, path)
+                continue
+            name = sc.name
             try:
                 if sc.flagbuildnone:
-                    subobj = obj.get(sc.name, None)
+                    subobj = obj.get(name, None)
                 else:
-                    subobj = obj[sc.name] # raises KeyError
+                    subobj = obj[name] # raises KeyError
 
-                if sc.name:
-                    context[sc.name] = subobj
+                if name:
+                    context[name] = subobj
 
                 buildret = sc._build(subobj, stream, context, path)
-                if sc.name:
-                    context[sc.name] = buildret
+                if name:
+                    context[name] = buildret
             except StopFieldError:
                 break
         return context
 
     def _sizeof(self, context, path):
+        if self._staticsize is not None:
+            return self._staticsize
         context = Container(_ = context, _params = context._params, _root = None, _parsing = context._parsing, _building = context._building, _sizing = context._sizing, _subcons = self._subcons, _io = None, _index = context.get("_index", None))
         context._root = context._.get("_root", context)
         try:
@@ -2027,7 +2174,14 @@ class Struct(Construct):
                 this['_root'] = this['_'].get('_root', this)
                 try:
         """ % (fname, )
-        for sc in self.subcons:
+        for sc in self._fusedsubcons:
+            if type(sc) is FormatFieldRun:
+                rname = "formatfieldrun_%s" % code.allocateId()
+                code.append("%s = struct.Struct(%r)" % (rname, sc.packer.format, ))
+                block += """
+                    %s = %s = %s.unpack(read_bytes(io, %s))
+                """ % (", ".join("result[%r]" % (n,) if n else "_" for n in sc.names), ", ".join("this[%r]" % (n,) if n else "_" for n in sc.names), rname, sc.packer.size, )
+                continue
             block += """
                     %s%s
             """ % ("result[%r] = this[%r] = " % (sc.name, sc.name) if sc.name else "", sc._compileparse(code))
@@ -2097,6 +2251,9 @@ class Sequence(Construct):
         super(Sequence, self).__init__()
         self.subcons = list(subcons) + list(k/v for k,v in subconskw.items())
         self._subcons = Container((sc.name,sc) for sc in self.subcons if sc.name)
+        self._fusedsubcons = FormatFieldRun.fuse(self.subcons)
+        sizes = [staticsizeof(sc) for sc in self.subcons]
+        self._staticsize = None if None in sizes else sum(sizes)
         self.flagbuildnone = all(sc.flagbuildnone for sc in self.subcons)
 
     def __getattr__(self, name):
@@ -2106,12 +2263,20 @@ class Sequence(Construct):
 
     def _parse(self, stream, context, path):
         obj = ListContainer()
+        append = obj.append
         context = Container(_ = context, _params = context._params, _root = None, _parsing = context._parsing, _building = context._building, _sizing = context._sizing, _subcons = self._subcons, _io = stream, _index = context.get("_index", None))
         context._root = context._.get("_root", context)
-        for i,sc in enumerate(self.subcons):
+        for sc in self._fusedsubcons:
+            if type(sc) is FormatFieldRun:
+                values = sc._parsevalues(stream, path)
+                obj.extend(values)
+                for name,value in zip(sc.names, values):
+                    if name:
+                        context[name] = value
+                continue
             try:
                 subobj = sc._parsereport(stream, context, path)
-                obj.append(subobj)
+                append(subobj)
                 if sc.name:
                     context[sc.name] = subobj
             except StopFieldError:
@@ -2124,13 +2289,14 @@ class Sequence(Construct):
         context = Container(_ = context, _params = context._params, _root = None, _parsing = context._parsing, _building = context._building, _sizing = context._sizing, _subcons = self._subcons, _io = stream, _index = context.get("_index", None))
         context._root = context._.get("_root", context)
         retlist = ListContainer()
-        for i,(sc,subobj) in enumerate(zip(self.subcons, obj)):
+        append = retlist.append
+        for sc,subobj in zip(self.subcons, obj):
             try:
                 if sc.name:
                     context[sc.name] = subobj
 
                 buildret = sc._build(subobj, stream, context, path)
-                retlist.append(buildret)
+                append(buildret)
                 if sc.name:
                     context[sc.name] = buildret
             except StopFieldError:
@@ -2138,6 +2304,8 @@ class Sequence(Construct):
         return retlist
 
     def _sizeof(self, context, path):
+        if self._staticsize is not None:
+            return self._staticsize
         context = Container(_ = context, _params = context._params, _root = None, _parsing = context._parsing, _building = context._building, _sizing = context._sizing, _subcons = self._subcons, _io = None, _index = context.get("_index", None))
         context._root = context._.get("_root", context)
         try:
@@ -2216,12 +2384,49 @@ class Array(Subconstruct):
             count = count(context)
         if not 0 <= count:
             raise RangeError("invalid count %s" % (count,), path=path)
+        if type(self.subcon) is FormatField and self.subcon.parsed is None:
+            # one read and one unpack for all elements, instead of a loop of them
+            endianity,format = self.subcon.fmtstr
+            length = count * self.subcon.length
+            try:
+                data = stream.read(length)
+            except Exception:
+                raise StreamError("stream.read() failed, requested %s bytes" % (length,), path=path)
+            if len(data) == length:
+                if count:
+                    context._index = count - 1
+                if self.discard:
+                    return ListContainer()
+                return ListContainer(struct.unpack("%s%d%s" % (endianity, count, format), data))
+            # not enough data, parse what was read element by element, so the element that ran out reports it
+            stream = io.BytesIO(data)
+        subcon = self.subcon
+        if type(subcon) is Struct and subcon.parsed is None and len(subcon._fusedsubcons) == 1 and type(subcon._fusedsubcons[0]) is FormatFieldRun:
+            # records made only of FormatFields, one read and one iter_unpack for all of them
+            run = subcon._fusedsubcons[0]
+            length = count * run.packer.size
+            try:
+                data = stream.read(length)
+            except Exception:
+                raise StreamError("stream.read() failed, requested %s bytes" % (length,), path=path)
+            if len(data) == length:
+                if count:
+                    context._index = count - 1
+                if self.discard:
+                    return ListContainer()
+                named = [(i,name) for i,name in enumerate(run.names) if name]
+                return ListContainer(Container(_io=stream, **{name:values[i] for i,name in named}) for values in run.packer.iter_unpack(data))
+            # not enough data, parse what was read element by element, so the element and member that ran out report it
+            stream = io.BytesIO(data)
+        parsereport = self.subcon._parsereport
+        discard = self.discard
         obj = ListContainer()
+        append = obj.append
         for i in range(count):
             context._index = i
-            e = self.subcon._parsereport(stream, context, path)
-            if not self.discard:
-                obj.append(e)
+            e = parsereport(stream, context, path)
+            if not discard:
+                append(e)
         return obj
 
     def _build(self, obj, stream, context, path):
@@ -2232,11 +2437,24 @@ class Array(Subconstruct):
             raise RangeError("invalid count %s" % (count,), path=path)
         if not len(obj) == count:
             raise RangeError("expected %d elements, found %d" % (count, len(obj)), path=path)
+        if type(self.subcon) is FormatField:
+            endianity,format = self.subcon.fmtstr
+            try:
+                data = struct.pack("%s%d%s" % (endianity, count, format), *obj)
+            except Exception:
+                # build elements one by one, so the offending element raises its own error
+                data = None
+            if data is not None:
+                stream_write(stream, data, count * self.subcon.length, path)
+                if count:
+                    context._index = count - 1
+                return ListContainer(obj)
+        build = self.subcon._build
         retlist = ListContainer()
+        append = retlist.append
         for i,e in enumerate(obj):
             context._index = i
-            buildret = self.subcon._build(e, stream, context, path)
-            retlist.append(buildret)
+            append(build(e, stream, context, path))
         return retlist
 
     def _sizeof(self, context, path):
@@ -2249,6 +2467,16 @@ class Array(Subconstruct):
         return count * self.subcon._sizeof(context, path)
 
     def _emitparse(self, code):
+        if type(self.subcon) is FormatField and not self.discard:
+            endianity,format = self.subcon.fmtstr
+            code.append("""
+                def parse_formatfieldarray(io, this, count, endianity, format, length):
+                    if not count >= 0: raise RangeError
+                    data = read_bytes(io, count * length)
+                    if count: this['_index'] = count - 1
+                    return ListContainer(struct.unpack('%s%d%s' % (endianity, count, format), data))
+            """)
+            return "parse_formatfieldarray(io, this, %s, %r, %r, %s)" % (self.count, endianity, format, self.subcon.length, )
         return "ListContainer((this.__setitem__('_index',i),(%s))[1] for i in range(%s))" % (self.subcon._compileparse(code), self.count, )
 
     def _emitfulltype(self, ksy, bitwise):
@@ -2285,14 +2513,19 @@ class GreedyRange(Subconstruct):
         self.discard = discard
 
     def _parse(self, stream, context, path):
+        subcon = self.subcon
+        discard = self.discard
         obj = ListContainer()
+        append = obj.append
+        fallback = stream_tell(stream, path)
+        tell = stream.tell
         try:
             for i in itertools.count():
                 context._index = i
-                fallback = stream_tell(stream, path)
-                e = self.subcon._parsereport(stream, context, path)
-                if not self.discard:
-                    obj.append(e)
+                fallback = tell()
+                e = subcon._parsereport(stream, context, path)
+                if not discard:
+                    append(e)
         except StopFieldError:
             pass
         except ExplicitError:
@@ -2302,12 +2535,13 @@ class GreedyRange(Subconstruct):
         return obj
 
     def _build(self, obj, stream, context, path):
+        build = self.subcon._build
         try:
             retlist = ListContainer()
+            append = retlist.append
             for i,e in enumerate(obj):
                 context._index = i
-                buildret = self.subcon._build(e, stream, context, path)
-                retlist.append(buildret)
+                append(build(e, stream, context, path))
             return retlist
         except StopFieldError:
             pass
@@ -2352,28 +2586,34 @@ class RepeatUntil(Subconstruct):
         self.predicate = predicate
         self.discard = discard
 
-    def _parse(self, stream, context, path):
+    def _predicate(self):
         predicate = self.predicate
         if not callable(predicate):
-            predicate = lambda _1,_2,_3: predicate
+            return lambda _1,_2,_3: predicate
+        return predicate
+
+    def _parse(self, stream, context, path):
+        predicate = self._predicate()
+        parsereport = self.subcon._parsereport
+        discard = self.discard
         obj = ListContainer()
+        append = obj.append
         for i in itertools.count():
             context._index = i
-            e = self.subcon._parsereport(stream, context, path)
-            if not self.discard:
-                obj.append(e)
+            e = parsereport(stream, context, path)
+            if not discard:
+                append(e)
             if predicate(e, obj, context):
                 return obj
 
     def _build(self, obj, stream, context, path):
-        predicate = self.predicate
-        if not callable(predicate):
-            predicate = lambda _1,_2,_3: predicate
+        predicate = self._predicate()
+        build = self.subcon._build
         partiallist = ListContainer()
         retlist = ListContainer()
         for i,e in enumerate(obj):
             context._index = i
-            buildret = self.subcon._build(e, stream, context, path)
+            buildret = build(e, stream, context, path)
             retlist.append(buildret)
             partiallist.append(buildret)
             if predicate(e, partiallist, context):
@@ -2431,20 +2671,24 @@ class Renamed(Subconstruct):
         self.name = newname if newname else subcon.name
         self.docs = newdocs if newdocs else subcon.docs
         self.parsed = newparsed if newparsed else subcon.parsed
+        if type(subcon) is Renamed and subcon.name == self.name and not (newparsed and subcon.parsed):
+            # collapse chains like "name" / Byte * "docs" into one wrapper, unless that would drop a name from error paths or a parsed hook
+            self.subcon = subcon.subcon
+        self._pathsuffix = " -> %s" % (self.name,)
 
     def __getattr__(self, name):
         return getattr(self.subcon, name)
 
     def _parse(self, stream, context, path):
-        path += " -> %s" % (self.name,)
+        path += self._pathsuffix
         return self.subcon._parsereport(stream, context, path)
 
     def _build(self, obj, stream, context, path):
-        path += " -> %s" % (self.name,)
+        path += self._pathsuffix
         return self.subcon._build(obj, stream, context, path)
 
     def _sizeof(self, context, path):
-        path += " -> %s" % (self.name,)
+        path += self._pathsuffix
         return self.subcon._sizeof(context, path)
 
     def _emitparse(self, code):
@@ -2505,9 +2749,28 @@ class Const(Subconstruct):
         super(Const, self).__init__(subcon)
         self.value = value
         self.flagbuildnone = True
+        # bytes or integer constants are compared and written as raw data, without the subcon
+        self._data = None
+        if type(subcon) is Bytes and subcon.parsed is None and isinstance(value, bytestringtype) and subcon.length == len(value):
+            self._data = value
+            self._parsed = value
+        if type(subcon) is FormatField and subcon.parsed is None and subcon.fmtstr[1] not in "fde":
+            try:
+                self._data = subcon._pack(value)
+                self._parsed = subcon._unpack(self._data)[0]
+            except Exception:
+                self._data = None
 
     def _parse(self, stream, context, path):
-        obj = self.subcon._parsereport(stream, context, path)
+        data = self._data
+        if data is not None:
+            obj = stream_read(stream, len(data), path)
+            if obj == data:
+                return self._parsed
+            if type(self.subcon) is FormatField:
+                obj = self.subcon._unpack(obj)[0]
+        else:
+            obj = self.subcon._parsereport(stream, context, path)
         if obj != self.value:
             raise ConstError("parsing expected %r but parsed %r" % (self.value, obj), path=path)
         return obj
@@ -2515,6 +2778,10 @@ class Const(Subconstruct):
     def _build(self, obj, stream, context, path):
         if obj not in (None, self.value):
             raise ConstError("building expected None or %r but got %r" % (self.value, obj), path=path)
+        data = self._data
+        if data is not None:
+            stream_write(stream, data, len(data), path)
+            return self.value
         return self.subcon._build(self.value, stream, context, path)
 
     def _sizeof(self, context, path):
@@ -2540,6 +2807,7 @@ class Computed(Construct):
     Parsing and Building return the value returned by the context lambda (although a constant value can also be used). Size is defined as 0 because parsing and building does not consume or produce bytes into the stream.
 
     :param func: context lambda or constant value
+    :param skipbuild: optional, bool, if set then building does not evaluate func and returns None (use when the value is only needed after parsing)
 
     Can propagate any exception from the lambda, possibly non-ConstructError.
 
@@ -2554,6 +2822,10 @@ class Computed(Construct):
         >>> d.parse(b"12")
         Container(width=49, height=50, total=2450)
 
+        >>> d = Computed(lambda ctx: expensive(ctx), skipbuild=True)
+        >>> d.build(None)
+        b''
+
         >>> d = Computed(7)
         >>> d.parse(b"")
         7
@@ -2567,16 +2839,21 @@ class Computed(Construct):
         b'\x98\xc2\xec\x10\x07\xf5\x8e\x98\xc2\xec'
     """
 
-    def __init__(self, func):
+    def __init__(self, func, skipbuild=False):
         super(Computed, self).__init__()
         self.func = func
+        self.skipbuild = skipbuild
         self.flagbuildnone = True
 
     def _parse(self, stream, context, path):
-        return self.func(context) if callable(self.func) else self.func
+        func = self.func
+        return func(context) if callable(func) else func
 
     def _build(self, obj, stream, context, path):
-        return self.func(context) if callable(self.func) else self.func
+        if self.skipbuild:
+            return None
+        func = self.func
+        return func(context) if callable(func) else func
 
     def _sizeof(self, context, path):
         return 0
@@ -2957,7 +3234,11 @@ class Numpy(Construct):
     r"""
     Preserves numpy arrays (both shape, dtype and values).
 
-    Parses using `numpy.load() <https://docs.scipy.org/doc/numpy/reference/generated/numpy.load.html#numpy.load>`_ and builds using `numpy.save() <https://docs.scipy.org/doc/numpy/reference/generated/numpy.save.html#numpy.save>`_ functions, using Numpy binary protocol. Size is undefined.
+    Parses using `numpy.load() <https://docs.scipy.org/doc/numpy/reference/generated/numpy.load.html#numpy.load>`_ and builds using `numpy.save() <https://docs.scipy.org/doc/numpy/reference/generated/numpy.save.html#numpy.save>`_ functions, using Numpy binary protocol. Size is undefined. Object arrays are not supported, pickling is disabled both ways.
+
+    Memory-mapping is available as an explicit option, `Numpy(mmap=True)`. When parsing from a regular file (like parse_file does), the array data is then not read but memory-mapped in copy-on-write mode, returning a `numpy.memmap <https://docs.scipy.org/doc/numpy/reference/generated/numpy.memmap.html>`_ instance. Modifying it does not change the file, but the array stays tied to the file: the file must not be truncated or rewritten (for example by build_file to the same path) while the array is in use, otherwise accessing the array can crash the interpreter.
+
+    :param mmap: bool, memory-map arrays parsed from regular files, default is False
 
     :raises ImportError: numpy could not be imported during parsing or building
     :raises ValueError: could not read enough bytes, or so
@@ -2972,15 +3253,51 @@ class Numpy(Construct):
         b"\x93NUMPY\x01\x00F\x00{'descr': '<i8', 'fortran_order': False, 'shape': (3,), }            \n\x01\x00\x00\x00\x00\x00\x00\x00\x02\x00\x00\x00\x00\x00\x00\x00\x03\x00\x00\x00\x00\x00\x00\x00"
         >>> Numpy.parse(_)
         array([1, 2, 3])
+        >>> Numpy(mmap=True).parse_file("array.npy")
+        memmap([1, 2, 3])
     """
 
+    def __init__(self, mmap=False):
+        super().__init__()
+        self.mmap = mmap
+
+    def __call__(self, mmap=False):
+        return type(self)(mmap)
+
+    def __reduce__(self):
+        return (Numpy, (self.mmap, ))
+
     def _parse(self, stream, context, path):
         import numpy
-        return numpy.load(stream)
+        # only real files can be mapped, wrappers like gzip files expose the name of a different file
+        if self.mmap and type(stream) in (io.FileIO, io.BufferedReader, io.BufferedRandom) and type(getattr(stream, "raw", stream)) is io.FileIO and stream.seekable():
+            array = self._parsememmap(numpy, stream)
+            if array is not None:
+                return array
+        return numpy.load(stream, allow_pickle=False)
+
+    def _parsememmap(self, numpy, stream):
+        from numpy.lib import format
+        fallback = stream.tell()
+        version = format.read_magic(stream)
+        if version == (1,0):
+            shape, fortran_order, dtype = format.read_array_header_1_0(stream)
+        elif version == (2,0):
+            shape, fortran_order, dtype = format.read_array_header_2_0(stream)
+        else:
+            shape, fortran_order, dtype = None, None, None
+        if dtype is None or dtype.hasobject or not shape or not all(shape):
+            stream.seek(fallback)
+            return None
+        offset = stream.tell()
+        order = "F" if fortran_order else "C"
+        array = numpy.memmap(stream, dtype=dtype, mode="c", offset=offset, shape=shape, order=order)
+        stream.seek(offset + array.nbytes)
+        return array
 
     def _build(self, obj, stream, context, path):
         import numpy
-        numpy.save(stream, obj)
+        numpy.save(stream, obj, allow_pickle=False)
         return obj
 
 
@@ -3302,6 +3619,8 @@ class Union(Construct):
         self.parsefrom = parsefrom
         self.subcons = list(subcons) + list(k/v for k,v in subconskw.items())
         self._subcons = Container((sc.name,sc) for sc in self.subcons if sc.name)
+        sizes = [staticsizeof(sc) for sc in self.subcons]
+        self._staticsizes = None if None in sizes or not sizes else sizes
 
     def __getattr__(self, name):
         if name in self._subcons:
@@ -3314,15 +3633,20 @@ class Union(Construct):
         context._root = context._.get("_root", context)
         fallback = stream_tell(stream, path)
         forwards = {}
+        staticsizes = self._staticsizes
         for i,sc in enumerate(self.subcons):
             subobj = sc._parsereport(stream, context, path)
+            if staticsizes is not None:
+                # all members are fixed size, so their forward offsets are known without a tell
+                forward = fallback + staticsizes[i]
+            else:
+                forward = stream_tell(stream, path)
+            stream_seek(stream, fallback, 0, path)
+            forwards[i] = forward
             if sc.name:
                 obj[sc.name] = subobj
                 context[sc.name] = subobj
-            forwards[i] = stream_tell(stream, path)
-            if sc.name:
-                forwards[sc.name] = stream_tell(stream, path)
-            stream_seek(stream, fallback, 0, path)
+                forwards[sc.name] = forward
         parsefrom = self.parsefrom
         if callable(parsefrom):
             parsefrom = parsefrom(context)
@@ -3414,7 +3738,10 @@ class Select(Construct):
 
     Parses and builds by literally trying each subcon in sequence until one of them parses or builds without exception. Stream gets reverted back to original position after each failed attempt, but not if parsing succeeds. Size is not defined.
 
+    If `discriminator` is given, building first calls it with the object and, if it returns a name of a subcon, builds only that subcon (errors are not caught). If it returns None or an unknown name, all subcons are tried as usual.
+
     :param \*subcons: Construct instances, list of members, some can be anonymous
+    :param discriminator: optional function taking the object to build and returning a subcon name or None, keyword-only
     :param \*\*subconskw: Construct instances, list of members (requires Python 3.6)
 
     :raises StreamError: requested reading negative amount, could not read enough bytes, requested writing different amount than actual data, or could not write all bytes
@@ -3431,16 +3758,22 @@ class Select(Construct):
 
         Alternative syntax, but requires Python 3.6 or any PyPy:
         >>> Select(num=Int32ub, text=CString("utf8"))
+
+        >>> d = Select(num=Int32ub, text=CString("utf8"), discriminator=lambda obj: "text" if isinstance(obj, str) else "num")
+        >>> d.build(u"Афон")
+        b'\xd0\x90\xd1\x84\xd0\xbe\xd0\xbd\x00'
     """
 
-    def __init__(self, *subcons, **subconskw):
+    def __init__(self, *subcons, discriminator=None, **subconskw):
         super(Select, self).__init__()
         self.subcons = list(subcons) + list(k/v for k,v in subconskw.items())
         self.flagbuildnone = any(sc.flagbuildnone for sc in self.subcons)
+        self.discriminator = discriminator
+        self._subcons = {sc.name:sc for sc in reversed(self.subcons) if sc.name}
 
     def _parse(self, stream, context, path):
+        fallback = stream_tell(stream, path)
         for sc in self.subcons:
-            fallback = stream_tell(stream, path)
             try:
                 obj = sc._parsereport(stream, context, path)
             except ExplicitError:
@@ -3452,9 +3785,16 @@ class Select(Construct):
         raise SelectError("no subconstruct matched", path=path)
 
     def _build(self, obj, stream, context, path):
+        if self.discriminator is not None:
+            sc = self._subcons.get(self.discriminator(obj))
+            if sc is not None:
+                sc._build(obj, stream, context, path)
+                return obj
         for sc in self.subcons:
             try:
-                data = sc.build(obj, **context)
+                stream2 = io.BytesIO()
+                sc._build(obj, stream2, context, path)
+                data = stream2.getvalue()
             except ExplicitError:
                 raise
             except Exception:
@@ -3786,31 +4126,52 @@ class Padded(Subconstruct):
         super(Padded, self).__init__(subcon)
         self.length = length
         self.pattern = pattern
+        # with a fixed size subcon (like Pass in Padding) the stream does not need to be told
+        self._subconsize = 0 if subcon is Pass else staticsizeof(subcon)
+        self._subconbuildsize = 0 if subcon is Pass else staticsizeof(subcon, building=True)
+        self._padding = None
+        if self._subconbuildsize is not None and isinstance(length, integertypes) and length >= self._subconbuildsize:
+            self._padding = pattern * (length - self._subconbuildsize)
 
     def _parse(self, stream, context, path):
-        length = evaluate(self.length, context)
+        length = self.length
+        if callable(length):
+            length = length(context)
         if length < 0:
             raise PaddingError("length cannot be negative", path=path)
-        position1 = stream_tell(stream, path)
-        obj = self.subcon._parsereport(stream, context, path)
-        position2 = stream_tell(stream, path)
-        pad = length - (position2 - position1)
+        if self._subconsize is not None:
+            obj = self.subcon._parsereport(stream, context, path)
+            size = self._subconsize
+        else:
+            position1 = stream_tell(stream, path)
+            obj = self.subcon._parsereport(stream, context, path)
+            size = stream_tell(stream, path) - position1
+        pad = length - size
         if pad < 0:
-            raise PaddingError("subcon parsed %d bytes but was allowed only %d" % (position2-position1, length), path=path)
+            raise PaddingError("subcon parsed %d bytes but was allowed only %d" % (size, length), path=path)
         stream_read(stream, pad, path)
         return obj
 
     def _build(self, obj, stream, context, path):
-        length = evaluate(self.length, context)
+        length = self.length
+        if callable(length):
+            length = length(context)
         if length < 0:
             raise PaddingError("length cannot be negative", path=path)
-        position1 = stream_tell(stream, path)
-        buildret = self.subcon._build(obj, stream, context, path)
-        position2 = stream_tell(stream, path)
-        pad = length - (position2 - position1)
+        if self._subconbuildsize is not None:
+            buildret = self.subcon._build(obj, stream, context, path)
+            size = self._subconbuildsize
+        else:
+            position1 = stream_tell(stream, path)
+            buildret = self.subcon._build(obj, stream, context, path)
+            size = stream_tell(stream, path) - position1
+        pad = length - size
         if pad < 0:
-            raise PaddingError("subcon build %d bytes but was allowed only %d" % (position2-position1, length), path=path)
-        stream_write(stream, self.pattern * pad, pad, path)
+            raise PaddingError("subcon build %d bytes but was allowed only %d" % (size, length), path=path)
+        padding = self._padding
+        if padding is None:
+            padding = self.pattern * pad
+        stream_write(stream, padding, pad, path)
         return buildret
 
     def _sizeof(self, context, path):
@@ -3862,15 +4223,24 @@ class Aligned(Subconstruct):
         super(Aligned, self).__init__(subcon)
         self.modulus = modulus
         self.pattern = pattern
+        self._subconsize = staticsizeof(subcon)
+        self._subconbuildsize = staticsizeof(subcon, building=True)
+        self._paddings = None
+        if isinstance(modulus, integertypes) and modulus >= 2:
+            self._paddings = tuple(pattern * i for i in range(modulus))
 
     def _parse(self, stream, context, path):
         modulus = self.modulus(context) if callable(self.modulus) else self.modulus
         if modulus < 2:
             raise PaddingError("expected modulo 2 or greater", path=path)
-        position1 = stream_tell(stream, path)
-        obj = self.subcon._parsereport(stream, context, path)
-        position2 = stream_tell(stream, path)
-        pad = -(position2 - position1) % modulus
+        if self._subconsize is not None:
+            obj = self.subcon._parsereport(stream, context, path)
+            size = self._subconsize
+        else:
+            position1 = stream_tell(stream, path)
+            obj = self.subcon._parsereport(stream, context, path)
+            size = stream_tell(stream, path) - position1
+        pad = -size % modulus
         stream_read(stream, pad, path)
         return obj
 
@@ -3878,11 +4248,16 @@ class Aligned(Subconstruct):
         modulus = self.modulus(context) if callable(self.modulus) else self.modulus
         if modulus < 2:
             raise PaddingError("expected modulo 2 or greater", path=path)
-        position1 = stream_tell(stream, path)
-        buildret = self.subcon._build(obj, stream, context, path)
-        position2 = stream_tell(stream, path)
-        pad = -(position2 - position1) % modulus
-        stream_write(stream, self.pattern * pad, pad, path)
+        if self._subconbuildsize is not None:
+            buildret = self.subcon._build(obj, stream, context, path)
+            size = self._subconbuildsize
+        else:
+            position1 = stream_tell(stream, path)
+            buildret = self.subcon._build(obj, stream, context, path)
+            size = stream_tell(stream, path) - position1
+        pad = -size % modulus
+        paddings = self._paddings
+        stream_write(stream, paddings[pad] if paddings is not None else self.pattern * pad, pad, path)
         return buildret
 
     def _sizeof(self, context, path):
@@ -3981,8 +4356,11 @@ class Pointer(Subconstruct):
         self.stream = stream
 
     def _parse(self, stream, context, path):
-        offset = evaluate(self.offset, context)
-        stream = evaluate(self.stream, context) or stream
+        offset = self.offset
+        if callable(offset):
+            offset = offset(context)
+        if self.stream is not None:
+            stream = evaluate(self.stream, context) or stream
         fallback = stream_tell(stream, path)
         stream_seek(stream, offset, 2 if offset < 0 else 0, path)
         obj = self.subcon._parsereport(stream, context, path)
@@ -3990,8 +4368,11 @@ class Pointer(Subconstruct):
         return obj
 
     def _build(self, obj, stream, context, path):
-        offset = evaluate(self.offset, context)
-        stream = evaluate(self.stream, context) or stream
+        offset = self.offset
+        if callable(offset):
+            offset = offset(context)
+        if self.stream is not None:
+            stream = evaluate(self.stream, context) or stream
         fallback = stream_tell(stream, path)
         stream_seek(stream, offset, 2 if offset < 0 else 0, path)
         buildret = self.subcon._build(obj, stream, context, path)
@@ -4025,6 +4406,8 @@ class Peek(Subconstruct):
 
     Parsing sub-parses (and returns None if failed), then reverts stream to original position. Building does nothing (its NOT deferred). Size is defined as 0 because there is no building.
 
+    If subcon is a plain fixed-size field (bytes or integer, possibly renamed), its bytes are read once and parsed from an in-memory copy instead of using tell and seek. Any other subcon is parsed from the original stream, so `_io` and stream positions it sees are the real ones.
+
     This class is used in :class:`~construct.core.Union` class to parse each member.
 
     :param subcon: Construct instance
@@ -4044,8 +4427,28 @@ class Peek(Subconstruct):
     def __init__(self, subcon):
         super(Peek, self).__init__(subcon)
         self.flagbuildnone = True
+        leaf = subcon
+        while type(leaf) is Renamed:
+            leaf = leaf.subcon
+        self._staticsize = staticsizeof(subcon) if isinstance(leaf, (Bytes, FormatField, BytesInteger, BitsInteger)) else None
 
     def _parse(self, stream, context, path):
+        size = self._staticsize
+        if size is not None:
+            # fixed size field, read its data once and rewind relatively, without tell
+            try:
+                data = stream.read(size)
+                stream.seek(-len(data), 1)
+            except Exception:
+                raise StreamError("stream is not seekable and tellable", path=path)
+            if len(data) != size:
+                return None
+            try:
+                return self.subcon._parsereport(io.BytesIO(data), context, path)
+            except ExplicitError:
+                raise
+            except ConstructError:
+                return None
         fallback = stream_tell(stream, path)
         try:
             return self.subcon._parsereport(stream, context, path)
@@ -4305,6 +4708,17 @@ def ByteSwapped(subcon):
         Int24ul <--> ByteSwapped(Int24ub) <--> BytesInteger(3, swapped=True) <--> ByteSwapped(BytesInteger(3))
     """
 
+    # plain numeric fields can simply be processed with opposite byte order
+    if type(subcon) is FormatField and subcon.parsed is None:
+        endianity,format = subcon.fmtstr
+        if endianity == "=":
+            endianity = "<" if sys.byteorder == "big" else ">"
+        else:
+            endianity = "<" if endianity == ">" else ">"
+        return FormatField(endianity, format)
+    if type(subcon) is BytesInteger and subcon.parsed is None and isinstance(subcon.length, integertypes):
+        return BytesInteger(subcon.length, subcon.signed, not subcon.swapped)
+
     size = subcon.sizeof()
     return Transformed(subcon, swapbytes, size, swapbytes, size)
 
@@ -4376,12 +4790,28 @@ class Prefixed(Subconstruct):
             return data
         if type(self.subcon) is GreedyString:
             return data.decode(self.subcon.encoding)
+        if isinstance(self.subcon, Tunnel) and type(self.subcon)._parse is Tunnel._parse:
+            # the tunnel would read the entire payload anyway, decode it without a temporary stream
+            obj = self.subcon._parsedata(data, context, path)
+            if self.subcon.parsed is not None:
+                self.subcon.parsed(obj, context)
+            return obj
         return self.subcon._parsereport(io.BytesIO(data), context, path)
 
     def _build(self, obj, stream, context, path):
-        stream2 = io.BytesIO()
-        buildret = self.subcon._build(obj, stream2, context, path)
-        data = stream2.getvalue()
+        if self.subcon is GreedyBytes:
+            # the payload is the object itself, no need to build it into a temporary stream
+            data = bytes(obj) if type(obj) is bytearray else obj
+            if not isinstance(data, bytestringtype):
+                raise StringError("given non-bytes value, perhaps unicode? %r" % (data,), path=path)
+            buildret = data
+        elif isinstance(self.subcon, Tunnel) and type(self.subcon)._build is Tunnel._build:
+            data = self.subcon._builddata(obj, context, path)
+            buildret = obj
+        else:
+            stream2 = io.BytesIO()
+            buildret = self.subcon._build(obj, stream2, context, path)
+            data = stream2.getvalue()
         length = len(data)
         if self.includelength:
             length += self.lengthfield._sizeof(context, path)
@@ -4500,14 +4930,23 @@ class FixedSized(Subconstruct):
         length = evaluate(self.length, context)
         if length < 0:
             raise PaddingError("length cannot be negative", path=path)
-        stream2 = io.BytesIO()
-        buildret = self.subcon._build(obj, stream2, context, path)
-        data = stream2.getvalue()
+        subcon = self.subcon
+        if subcon is GreedyBytes or (type(subcon) is NullStripped and subcon.subcon is GreedyBytes):
+            # the payload is the object itself (like in PaddedString), no need to build it into a temporary stream
+            data = bytes(obj) if type(obj) is bytearray else obj
+            if not isinstance(data, bytestringtype):
+                raise StringError("given non-bytes value, perhaps unicode? %r" % (data,), path=path)
+            buildret = data
+        else:
+            stream2 = io.BytesIO()
+            buildret = subcon._build(obj, stream2, context, path)
+            data = stream2.getvalue()
         pad = length - len(data)
         if pad < 0:
             raise PaddingError("subcon build %d bytes but was allowed only %d" % (len(data), length), path=path)
         stream_write(stream, data, len(data), path)
-        stream_write(stream, bytes(pad), pad, path)
+        if pad:
+            stream_write(stream, bytes(pad), pad, path)
         return buildret
 
     def _sizeof(self, context, path):
@@ -4527,7 +4966,7 @@ class NullTerminated(Subconstruct):
     r"""
     Restricts parsing to bytes preceding a null byte.
 
-    Parsing reads one byte at a time and accumulates it with previous bytes. When term was found, (by default) consumes but discards the term. When EOF was found, (by default) raises same StreamError exception. Then subcon is parsed using new BytesIO made with said data. Building builds the subcon and then writes the term. Size is undefined.
+    Parsing reads one byte at a time and accumulates it with previous bytes (BytesIO streams are scanned in larger chunks instead, with same results). When term was found, (by default) consumes but discards the term. When EOF was found, (by default) raises same StreamError exception. Then subcon is parsed using new BytesIO made with said data. Building builds the subcon and then writes the term. Size is undefined.
 
     The term can be multiple bytes, to support string classes with UTF16/32 encodings.
 
@@ -4563,6 +5002,48 @@ class NullTerminated(Subconstruct):
         if unit < 1:
             raise PaddingError("NullTerminated term must be at least 1 byte", path=path)
         data = b''
+        if type(stream) is io.BytesIO:
+            # in-memory data can be read ahead safely, scan it in chunks and seek back after the term
+            chunks = []
+            size = 64 * unit
+            while True:
+                chunk = stream.read(size)
+                index = chunk.find(term)
+                while index > 0 and index % unit:
+                    index = chunk.find(term, index + 1)
+                if index >= 0:
+                    chunks.append(chunk[:index + unit] if self.include else chunk[:index])
+                    stream.seek((index + unit if self.consume else index) - len(chunk), 1)
+                    return self._parsedata(b"".join(chunks), context, path)
+                if len(chunk) < size:
+                    # EOF without term, the loop below handles the incomplete unit (if any) and reports
+                    tail = len(chunk) % unit
+                    chunks.append(chunk[:len(chunk) - tail])
+                    stream.seek(-tail, 1)
+                    data = b"".join(chunks)
+                    break
+                chunks.append(chunk)
+                size *= 2
+        elif hasattr(stream, "peek"):
+            # buffered streams can be scanned in place, reading exactly the bytes that were used
+            chunks = []
+            while True:
+                window = stream.peek(unit)
+                if len(window) < unit:
+                    # EOF or an incomplete unit buffered, the loop below handles the rest
+                    break
+                window = window[:len(window) - len(window) % unit]
+                index = window.find(term)
+                while index > 0 and index % unit:
+                    index = window.find(term, index + 1)
+                if index >= 0:
+                    chunks.append(window[:index + unit] if self.include else window[:index])
+                    stream.read(index + unit if self.consume else index)
+                    return self._parsedata(b"".join(chunks), context, path)
+                chunks.append(window)
+                stream.read(len(window))
+            data = b"".join(chunks)
+        buffer = bytearray(data)
         while True:
             try:
                 b = stream_read(stream, unit, path)
@@ -4573,11 +5054,14 @@ class NullTerminated(Subconstruct):
                     break
             if b == term:
                 if self.include:
-                    data += b
+                    buffer += b
                 if not self.consume:
                     stream_seek(stream, -unit, 1, path)
                 break
-            data += b
+            buffer += b
+        return self._parsedata(bytes(buffer), context, path)
+
+    def _parsedata(self, data, context, path):
         if self.subcon is GreedyBytes:
             return data
         if type(self.subcon) is GreedyString:
@@ -4632,6 +5116,11 @@ class NullStripped(Subconstruct):
         data = stream_read_entire(stream, path)
         if unit == 1:
             data = data.rstrip(pad)
+        elif pad == pad[:1] * unit:
+            # uniform pad (like utf16/32 nulls), strip bytes in one go then round up to unit boundary
+            end = len(data.rstrip(pad[:1]))
+            if end <= len(data) - len(data) % unit:
+                data = data[:-(-end // unit) * unit]
         else:
             tailunit = len(data) % unit
             end = len(data)
@@ -5302,6 +5791,8 @@ class LazyStruct(Construct):
         self.subcons = list(subcons) + list(k/v for k,v in subconskw.items())
         self._subcons = Container((sc.name,sc) for sc in self.subcons if sc.name)
         self._subconsindexes = Container((sc.name,i) for i,sc in enumerate(self.subcons) if sc.name)
+        self._staticsizes = [staticsizeof(sc) for sc in self.subcons]
+        self._buildplan = [(sc, sc.name, sc.flagbuildnone) for sc in self.subcons]
         self.flagbuildnone = all(sc.flagbuildnone for sc in self.subcons)
 
     def __getattr__(self, name):
@@ -5313,9 +5804,17 @@ class LazyStruct(Construct):
         context = Container(_ = context, _params = context._params, _root = None, _parsing = context._parsing, _building = context._building, _sizing = context._sizing, _subcons = self._subcons, _io = stream, _index = context.get("_index", None))
         context._root = context._.get("_root", context)
         offset = stream_tell(stream, path)
+        position = offset
         offsets = {0: offset}
         values = {}
-        for i,sc in enumerate(self.subcons):
+        for i,(sc,size) in enumerate(zip(self.subcons, self._staticsizes)):
+            if size is not None:
+                # fixed size members are skipped arithmetically, the stream is seeked only when needed
+                offset += size
+                offsets[i+1] = offset
+                continue
+            if position != offset:
+                stream_seek(stream, offset, 0, path)
             try:
                 offset += sc._actualsize(stream, context, path)
                 stream_seek(stream, offset, 0, path)
@@ -5325,7 +5824,10 @@ class LazyStruct(Construct):
                 if sc.name:
                     context[sc.name] = parseret
                 offset = stream_tell(stream, path)
+            position = offset
             offsets[i+1] = offset
+        if position != offset:
+            stream_seek(stream, offset, 0, path)
         return LazyContainer(self, stream, offsets, values, context, path)
 
     def _build(self, obj, stream, context, path):
@@ -5335,19 +5837,19 @@ class LazyStruct(Construct):
         context = Container(_ = context, _params = context._params, _root = None, _parsing = context._parsing, _building = context._building, _sizing = context._sizing, _subcons = self._subcons, _io = stream, _index = context.get("_index", None))
         context._root = context._.get("_root", context)
         context.update(obj)
-        for sc in self.subcons:
+        for sc, name, buildnone in self._buildplan:
             try:
-                if sc.flagbuildnone:
-                    subobj = obj.get(sc.name, None)
+                if buildnone:
+                    subobj = obj.get(name, None)
                 else:
-                    subobj = obj[sc.name] # raises KeyError
+                    subobj = obj[name] # raises KeyError
 
-                if sc.name:
-                    context[sc.name] = subobj
+                if name:
+                    context[name] = subobj
 
                 buildret = sc._build(subobj, stream, context, path)
-                if sc.name:
-                    context[sc.name] = buildret
+                if name:
+                    context[name] = buildret
             except StopFieldError:
                 break
         return context
@@ -5436,8 +5938,18 @@ class LazyArray(Subconstruct):
         if not 0 <= count:
             raise RangeError("invalid count %s" % (count,), path=path)
         offset = stream_tell(stream, path)
-        offsets = {0: offset}
         values = {}
+        if getattr(sc._actualsize, "__func__", None) is Construct._actualsize:
+            # element size does not depend on stream, so all offsets are known up front
+            try:
+                size = sc._sizeof(context, path)
+            except SizeofError:
+                pass
+            else:
+                offsets = {i: offset + i*size for i in range(count+1)}
+                stream_seek(stream, offsets[count], 0, path)
+                return LazyListContainer(sc, stream, count, offsets, values, context, path)
+        offsets = {0: offset}
         for i in range(count):
             try:
                 offset += sc._actualsize(stream, context, path)
@@ -5478,13 +5990,13 @@ class LazyArray(Subconstruct):
 
 class LazyBound(Construct):
     r"""
-    Field that binds to the subcon only at runtime (during parsing and building, not ctor). Useful for recursive data structures, like linked-lists and trees, where a construct needs to refer to itself (while it does not exist yet in the namespace).
+    Field that binds to the subcon only at runtime (during parsing, building and sizing, not ctor). Useful for recursive data structures, like linked-lists and trees, where a construct needs to refer to itself (while it does not exist yet in the namespace).
 
     Note that it is possible to obtain same effect without using this class, using a loop. However there are usecases where that is not possible (if remaining nodes cannot be sized-up, and there is data following the recursive structure). There is also a significant difference, namely that LazyBound actually does greedy parsing while the loop does lazy parsing. See examples.
 
     To break recursion, use `If` field. See examples.
 
-    :param subconfunc: parameter-less lambda returning Construct instance, can also return itself
+    :param subconfunc: parameter-less lambda returning Construct instance, can also return itself, called once on first use
 
     Example::
 
@@ -5529,15 +6041,43 @@ class LazyBound(Construct):
     def __init__(self, subconfunc):
         super(LazyBound, self).__init__()
         self.subconfunc = subconfunc
+        self._bound = None
+        self._staticsize = None
+        self._sizingthreads = set()
+
+    def _bind(self):
+        sc = self._bound = self.subconfunc()
+        self._staticsize = staticsizeof(sc)
+        return sc
 
     def _parse(self, stream, context, path):
-        sc = self.subconfunc()
+        sc = self._bound
+        if sc is None:
+            sc = self._bind()
         return sc._parsereport(stream, context, path)
 
     def _build(self, obj, stream, context, path):
-        sc = self.subconfunc()
+        sc = self._bound
+        if sc is None:
+            sc = self._bind()
         return sc._build(obj, stream, context, path)
 
+    def _sizeof(self, context, path):
+        sc = self._bound
+        if sc is None:
+            sc = self._bind()
+        if self._staticsize is not None:
+            return self._staticsize
+        # a recursive grammar would size itself forever, unless an If or similar stops it first
+        thread = threading.get_ident()
+        if thread in self._sizingthreads:
+            raise SizeofError("recursive LazyBound has no fixed size", path=path)
+        self._sizingthreads.add(thread)
+        try:
+            return sc._sizeof(context, path)
+        finally:
+            self._sizingthreads.discard(thread)
+
 
 #===============================================================================
 # adapters and validators
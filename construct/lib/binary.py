@@ -27,7 +27,7 @@ def integer2bits(number, width):
 
 def integer2bytes(number, width):
     r"""
-    Converts a bytes-string into an integer. This is reverse to `bytes2integer`.
+    Converts an integer into a bytes-string. Negative numbers are represented in 2-s complement. Raises OverflowError if number does not fit in width bytes. This is reverse to `bytes2integer`.
 
     Examples:
 
@@ -39,13 +39,8 @@ def integer2bytes(number, width):
     number = int(number)
     if number < 0:
         number += 1 << (width * 8)
-    acc = [b"\x00"] * width
-    i = width - 1
-    while number > 0:
-        acc[i] = int2byte(number & 255)
-        number >>= 8
-        i -= 1
-    return b"".join(acc)
+    # raises OverflowError if number does not fit in width bytes
+    return number.to_bytes(width, "big")
 
 
 def bits2integer(data, signed=False):
@@ -77,15 +72,7 @@ def bytes2integer(data, signed=False):
         >>> bytes2integer(b'\x00\x00\x00\x13')
         19
     """
-    number = 0
-    for b in iterateints(data):
-        number = (number << 8) | b
-
-    if signed and byte2int(bytes2bits(data[0:1])[0:1]):
-        bias = 1 << len(data)*8
-        return number - bias
-    else:
-        return number
+    return int.from_bytes(data, "big", signed=signed)
 
 
 BYTES2BITS_CACHE = {i:integer2bits(i,8) for i in range(256)}
@@ -131,6 +131,11 @@ class Container(dict):
             dict.__delitem__(self, key)
 
     def __init__(self, *args, **entrieskw):
+        if not args:
+            # fast path, keyword keys are unique and already ordered
+            dict.update(self, entrieskw)
+            self.__keys_order__ = list(entrieskw)
+            return
         self.__keys_order__ = []
         for arg in args:
             if isinstance(arg, dict):
@@ -190,7 +195,10 @@ class Container(dict):
         self.__keys_order__ = state
 
     def copy(self):
-        return Container(self)
+        c = dict.__new__(Container)
+        dict.update(c, self)
+        c.__keys_order__ = list(self.__keys_order__)
+        return c
 
     __update__ = update
 
@@ -11,15 +11,14 @@ integertypes = (int, )
 unicodestringtype = str
 bytestringtype = bytes
 
+# Converts (0 through 255) integer into b'...' character.
+# Bound lookups avoid a Python-level call frame on every conversion.
 INT2BYTE_CACHE = {i:bytes([i]) for i in range(256)}
-def int2byte(character):
-    """Converts (0 through 255) integer into b'...' character."""
-    return INT2BYTE_CACHE[character]
+int2byte = INT2BYTE_CACHE.__getitem__
 
+# Converts b'...' character into (0 through 255) integer.
 BYTE2INT_CACHE = {bytes([i]):i for i in range(256)}
-def byte2int(character):
-    """Converts b'...' character into (0 through 255) integer."""
-    return BYTE2INT_CACHE[character]
+byte2int = BYTE2INT_CACHE.__getitem__
 
 def str2bytes(string):
     """Converts '...' string into b'...' string. On PY2 they are equivalent. On PY3 its utf8 encoded."""
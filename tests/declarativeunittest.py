@@ -12,6 +12,14 @@ ident = lambda x: x
 devzero = open("/dev/zero", "rb")
 
 
+def pipestream(data):
+    # readable stream that can neither tell nor seek
+    r, w = os.pipe()
+    os.write(w, data)
+    os.close(w)
+    return os.fdopen(r, "rb")
+
+
 def raises(func, *args, **kw):
     try:
         return func(*args, **kw)
@@ -11,11 +11,9 @@ def test_png():
 def test_emf():
     commondumpdeprecated(emf_file, "emf1.emf")
 
-def test_bitmap():
-    commondumpdeprecated(bitmap_file, "bitmap1.bmp")
-    commondumpdeprecated(bitmap_file, "bitmap4.bmp")
-    commondumpdeprecated(bitmap_file, "bitmap8.bmp")
-    commondumpdeprecated(bitmap_file, "bitmap24.bmp")
+@pytest.mark.parametrize("filename", ["bitmap1.bmp", "bitmap4.bmp", "bitmap8.bmp", "bitmap24.bmp"])
+def test_bitmap(filename):
+    commondumpdeprecated(bitmap_file, filename)
 
 def test_wmf():
     commondumpdeprecated(wmf_file, "wmf1.wmf")
@@ -32,10 +30,9 @@ def test_cap():
 def test_snoop():
     commondumpdeprecated(snoop_file, "snoop1")
 
-def test_pe32():
-    commondumpdeprecated(pe32_file, "python.exe")
-    commondumpdeprecated(pe32_file, "NOTEPAD.EXE")
-    commondumpdeprecated(pe32_file, "sqlite3.dll")
+@pytest.mark.parametrize("filename", ["python.exe", "NOTEPAD.EXE", "sqlite3.dll"])
+def test_pe32(filename):
+    commondumpdeprecated(pe32_file, filename)
 
 def test_elf32():
     commondumpdeprecated(elf32_file, "ctypes.so")
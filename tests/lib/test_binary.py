@@ -19,6 +19,8 @@ def test_integer2bytes():
     assert integer2bytes(255, 4) == b"\x00\x00\x00\xff"
     assert integer2bytes(-1, 4) == b"\xff\xff\xff\xff"
     assert integer2bytes(-255, 4) == b"\xff\xff\xff\x01"
+    assert raises(integer2bytes, 0x1234, 1) == OverflowError
+    assert raises(integer2bytes, -0x1234, 1) == OverflowError
     assert raises(integer2bytes, 19, -1) == ValueError
     assert raises(integer2bytes, -19, -1) == ValueError
 
@@ -129,6 +129,9 @@ def test_copy_method():
     d = c.copy()
     assert c == d
     assert c is not d
+    d.b = 2
+    assert list(c.keys()) == ["a"]
+    assert list(d.keys()) == ["a", "b"]
 
 def test_copy():
     from copy import copy, deepcopy
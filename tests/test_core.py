@@ -12,6 +12,7 @@ def test_bytes():
     assert raises(d.build, b"looooooooooooooong") == StreamError
     assert d.build(1) == b"\x00\x00\x00\x01"
     assert d.build(0x01020304) == b"\x01\x02\x03\x04"
+    assert raises(d.build, 2**40) == IntegerError
 
     d = Bytes(this.n)
     common(d, b"1234", b"1234", 4, n=4)
@@ -105,6 +106,10 @@ def test_formatfield():
     assert raises(d.build, 1e9999) == FormatFieldError
     assert raises(d.build, "string not int") == FormatFieldError
 
+def test_formatfield_shares_packer():
+    assert FormatField("<","L").packer is FormatField("<","L").packer
+    assert FormatField("<","L").packer is not FormatField(">","L").packer
+
 def test_formatfield_ints_randomized():
     for endianess,dtype in itertools.product("<>=","bhlqBHLQ"):
         d = FormatField(endianess, dtype)
@@ -138,6 +143,8 @@ def test_bytesinteger():
     common(d, b"\xff\xff\xff\xff", -1, 4)
     assert raises(BytesInteger(this.missing).sizeof) == SizeofError
     assert raises(BytesInteger(4, signed=False).build, -1) == IntegerError
+    assert raises(BytesInteger(2).build, 2**40) == IntegerError
+    assert raises(BytesInteger(2, signed=True).build, -2**40) == IntegerError
     common(BytesInteger(0), b"", 0, 0)
 
 def test_bitsinteger():
@@ -358,6 +365,31 @@ def test_struct():
     d = Struct(Computed(7), Const(b"JPEG"), Pass, Terminated)
     assert d.build(None) == d.build({})
 
+def test_struct_formatfieldrun():
+    d = Struct("a"/Int8ub, "b"/Int16ub, "c"/Int32ul, "d"/Int16sl, "e"/Bytes(1), "f"/Computed(this.a+this.d))
+    common(d, b"\x01\x00\x02\x03\x00\x00\x00\xff\xffx", Container(a=1,b=2,c=3,d=-1,e=b"x",f=0), 10)
+    assert raises(d.parse, b"\x01\x00") == StreamError
+    assert raises(d.build, dict(a=1,b=2**16,c=3,d=-1,e=b"x")) == FormatFieldError
+    assert raises(d.build, dict(a=1,c=3,d=-1,e=b"x")) == KeyError
+    with pytest.raises(StreamError, match="-> b"):
+        d.parse(b"\x01\x00")
+    with pytest.raises(FormatFieldError, match="-> b"):
+        d.build(dict(a=1,b=2**16,c=3,d=-1,e=b"x"))
+    with pytest.raises(FormatFieldError, match="-> a"):
+        d.build(dict(a=256,c=3,d=-1,e=b"x"))
+
+def test_struct_pass():
+    d = Struct("a"/Int8ub, Pass, "b"/Int8ub, "c"/Pass)
+    common(d, b"\x01\x02", Container(a=1,b=2,c=None), 2)
+
+def test_struct_staticsize():
+    d = Struct("a"/Int16ub, "b"/Bytes(3), "c"/Byte[2], "d"/Sequence(Byte, Int32ul))
+    assert d.sizeof() == 12
+    assert Padded(14, d).parse_stream(pipestream(bytes(14))).d == [0, 0]
+    d = Struct("n"/Byte, "b"/Bytes(this.n))
+    assert raises(d.sizeof) == SizeofError
+    assert raises(Padded(14, d).parse_stream, pipestream(bytes(14))) == StreamError
+
 def test_struct_nested():
     d = Struct("a"/Byte, "b"/Int16ub, "inner"/Struct("c"/Byte, "d"/Byte))
     common(d, b"\x01\x00\x02\x03\x04", Container(a=1,b=2,inner=Container(c=3,d=4)), 5)
@@ -400,6 +432,12 @@ def test_sequence():
     d = Sequence(Computed(7), Const(b"JPEG"), Pass, Terminated)
     assert d.build(None) == d.build([None,None,None,None])
 
+def test_sequence_formatfieldrun():
+    d = Sequence(Int8ub, "n"/Int16ub, Int32sl, "data"/Bytes(this.n))
+    common(d, b"\x01\x00\x02\xff\xff\xff\xffab", [1,2,-1,b"ab"], SizeofError)
+    with pytest.raises(StreamError, match="-> n"):
+        d.parse(b"\x01\x00")
+
 def test_sequence_nested():
     common(Sequence(Int8ub, Int16ub, Sequence(Int8ub, Int8ub)), b"\x01\x00\x02\x03\x04", [1,2,[3,4]], 5)
 
@@ -424,6 +462,32 @@ def test_array():
     assert raises(d.sizeof) == SizeofError
     assert raises(d.sizeof, n=3) == 3
 
+def test_array_formatfield():
+    d = Array(3, Int16ub)
+    common(d, b"\x00\x01\x00\x02\x00\x03", [1,2,3], 6)
+    assert Array(2, Int32sl).parse(b"\xff\xff\xff\xff\x01\x00\x00\x00") == [-1,1]
+    assert Array(2, Int16ub, discard=True).parse(b"\x00\x01\x00\x02") == []
+    assert raises(d.parse, b"\x00\x01\x00") == StreamError
+    assert raises(d.build, [1,2,2**16]) == FormatFieldError
+    with pytest.raises(FormatFieldError, match="given value 65536"):
+        d.build([1,2,2**16])
+    d = Struct("n"/Int8sb, "a"/Array(this.n, Int16ub), "i"/Computed(this._index))
+    common(d, b"\x02\x00\x01\x00\x02", Container(n=2, a=[1,2], i=1), SizeofError)
+    assert d.compile().parse(b"\x02\x00\x01\x00\x02") == Container(n=2, a=[1,2], i=1)
+    assert raises(d.parse, b"\xff") == RangeError
+    assert raises(d.compile().parse, b"\xff") == RangeError
+
+def test_array_formatfieldstruct():
+    d = Array(2, Struct("a"/Int8ub, "b"/Int16ul))
+    common(d, b"\x01\x02\x00\x03\x04\x00", [dict(a=1,b=2),dict(a=3,b=4)], 6)
+    d = Array(2, Struct("a"/Int8ub, Int8ub, "b"/Int16ul))
+    assert d.parse(b"\x01\x00\x02\x00\x03\x00\x04\x00") == [dict(a=1,b=2),dict(a=3,b=4)]
+    assert list(d.parse(b"\x01\x00\x02\x00\x03\x00\x04\x00")[0].keys()) == ["_io", "a", "b"]
+    assert Array(2, d.subcon, discard=True).parse(b"\x01\x00\x02\x00\x03\x00\x04\x00") == []
+    assert raises(d.parse, b"\x01\x00\x02\x00\x03") == StreamError
+    with pytest.raises(StreamError, match="-> b\nstream read less than specified amount, expected 2, found 1"):
+        d.parse(b"\x01\x00\x02\x00\x03\x00\x04")
+
 def test_array_nontellable():
     assert Array(5, Byte).parse_stream(devzero) == [0,0,0,0,0]
 
@@ -447,6 +511,9 @@ def test_repeatuntil():
     d = RepeatUntil(True, Byte)
     assert d.parse(b"\x00") == [0]
     assert d.build([0]) == b"\x00"
+    d = RepeatUntil(False, Byte)
+    assert raises(d.parse, b"\x00\x01") == StreamError
+    assert raises(d.build, [0,1]) == RepeatError
 
 def test_const():
     common(Const(b"MZ"), b"MZ", b"MZ", 2)
@@ -456,6 +523,14 @@ def test_const():
     assert raises(Const(b"MZ").build, b"???") == ConstError
     assert raises(Const(255, Int32ul).parse, b"\x00\x00\x00\x00") == ConstError
     assert Struct(Const(b"MZ")).build({}) == b"MZ"
+    common(Const(1.5, Float32b), b"\x3f\xc0\x00\x00", 1.5, 4)
+    assert raises(Const(1.5, Float32b).parse, b"\x00\x00\x00\x00") == ConstError
+    with pytest.raises(ConstError, match="expected 255 but parsed 0"):
+        Const(255, Int32ul).parse(b"\x00\x00\x00\x00")
+    assert raises(Const(b"MZ").parse, b"M") == StreamError
+    # parsing returns what the subcon decodes, not the given constant
+    assert type(Const(True, Int8ub).parse(b"\x01")) is int
+    assert Const(True, Int8ub).parse(b"\x01") == 1
     # non-prefixed string literals are unicode on Python 3
     assert raises(lambda: Const(u"no prefix string")) == StringError
 
@@ -467,6 +542,10 @@ def test_computed():
     assert raises(Computed(this.missing).parse, b"") == KeyError
     assert raises(Computed(this["missing"]).parse, b"") == KeyError
 
+    d = Struct("x" / Byte, "y" / Computed(this.missing, skipbuild=True))
+    assert d.build(dict(x=1)) == b"\x01"
+    assert raises(d.parse, b"\x01") == KeyError
+
 def test_index():
     d = Array(3, Bytes(this._index+1))
     common(d, b"abbccc", [b"a", b"bb", b"ccc"])
@@ -579,6 +658,35 @@ def test_numpy():
     obj = numpy.array([1,2,3], dtype=numpy.int64)
     assert numpy.array_equal(Numpy.parse(Numpy.build(obj)), obj)
 
+def test_numpy_file():
+    import numpy
+    obj = numpy.arange(12, dtype=numpy.int32).reshape(3,4)
+    d = Struct("a"/Numpy, "b"/Byte)
+    d.build_file(dict(a=obj, b=255), 'out')
+    x = d.parse_file('out')
+    assert not isinstance(x.a, numpy.memmap)
+    d.build_file(x, 'out')
+    assert numpy.array_equal(d.parse_file('out').a, obj)
+    d = Struct("a"/Numpy(mmap=True), "b"/Byte)
+    x = d.parse_file('out')
+    assert isinstance(x.a, numpy.memmap)
+    assert numpy.array_equal(x.a, obj)
+    assert x.b == 255
+    x.a[0,0] = 100
+    assert numpy.array_equal(d.parse_file('out').a, obj)
+    obj = numpy.array([1,2], dtype=object)
+    assert raises(Numpy.build, obj) == ValueError
+
+def test_numpy_gzipfile():
+    import numpy, gzip
+    for obj in [numpy.arange(1000, dtype=numpy.int32), numpy.arange(3, dtype=numpy.int32)]:
+        with gzip.open('out', 'wb') as f:
+            Numpy.build_stream(obj, f)
+        with gzip.open('out', 'rb') as f:
+            x = Numpy.parse_stream(f)
+        assert not isinstance(x, numpy.memmap)
+        assert numpy.array_equal(x, obj)
+
 @xfail(reason="docs stated that it throws StreamError, not true at all")
 def test_numpy_error():
     import numpy, io
@@ -689,6 +797,20 @@ def test_union():
     # regression check, so first subcon is not parsefrom by accident
     assert raises(Union, Byte, VarInt) == UnionError
 
+def test_union_staticsizes():
+    d = Struct("u"/Union("b", "a"/Bytes(4), "b"/Int16ub, "c"/Byte[3]), "tail"/Byte)
+    assert d.parse(b"\x01\x02\x03\x04") == Container(u=Container(a=b"\x01\x02\x03\x04", b=0x0102, c=[1,2,3]), tail=3)
+    d = Union(None, "a"/Bytes(4), "b"/Int16ub)
+    assert raises(d.parse, b"\x01\x02") == StreamError
+    stream = io.BytesIO(b"\x01\x02\x03\x04")
+    d.parse_stream(stream)
+    assert stream.tell() == 0
+    ios = []
+    d = Union(None, "a"/Struct("x"/Byte * (lambda obj,ctx: ios.append(ctx._io))), "b"/Int16ub)
+    stream = io.BytesIO(b"\x01\x02")
+    assert d.parse_stream(stream).a._io is stream
+    assert ios == [stream]
+
 def test_union_kwctor():
     d = Union(None, a=Int8ub, b=Int16ub, c=Int32ub)
     assert d.parse(b"\x01\x02\x03\x04") == Container(a=0x01,b=0x0102,c=0x01020304)
@@ -715,6 +837,21 @@ def test_select_kwctor():
     assert d.parse(b"\x01\x02\x03\x04") == 0x01
     assert d.build(0x01020304) == b"\x01\x02\x03\x04"
 
+def test_select_build_context():
+    d = Struct("x" / Select(Bytes(this._params.n), Pass))
+    assert d.build(dict(x=b"ab"), n=2) == b"ab"
+    d = Struct("n" / Byte, "inner" / Struct("x" / Select(Bytes(this._.n), Pass)))
+    assert d.build(dict(n=2, inner=dict(x=b"ab"))) == b"\x02ab"
+
+def test_select_discriminator():
+    d = Select(num=Int32ub, text=CString("utf8"), discriminator=lambda obj: "text" if isinstance(obj, str) else "num")
+    assert d.build(1) == b"\x00\x00\x00\x01"
+    assert d.build(u"Афон") == b"\xd0\x90\xd1\x84\xd0\xbe\xd0\xbd\x00"
+    assert d.parse(b"\x00\x00\x00\x01") == 1
+    assert raises(d.build, -1) == FormatFieldError
+    d = Select(num=Int32ub, text=CString("utf8"), discriminator=lambda obj: None)
+    assert d.build(u"Афон") == b"\xd0\x90\xd1\x84\xd0\xbe\xd0\xbd\x00"
+
 def test_optional():
     d = Optional(Int32ul)
     assert d.parse(b"\x01\x00\x00\x00") == 1
@@ -821,6 +958,18 @@ def test_padded():
     assert Padded(4, VarInt).sizeof() == 4
     assert Padded(4, Byte[this.missing]).sizeof() == 4
 
+def test_padded_staticsubcon():
+    d = Padded(4, Bytes(2))
+    common(d, b"ab\x00\x00", b"ab", 4)
+    assert d.parse_stream(pipestream(b"ab\x00\x00")) == b"ab"
+    assert Padded(this.n, Bytes(2)).build(b"ab", n=3) == b"ab\x00"
+    assert raises(Padded(1, Bytes(2)).parse, b"ab") == PaddingError
+    assert raises(Padded(1, Bytes(2)).build, b"ab") == PaddingError
+    assert Padding(3).parse_stream(devzero) == None
+    assert Padded(4, Int16ub).parse_stream(devzero) == 0
+    assert Padded(6, Sequence(Byte, Byte)).build([1]) == b"\x01\x00\x00\x00\x00\x00"
+    assert Padded(6, Struct("a"/Sequence(Byte, Byte))).build(dict(a=[1])) == b"\x01\x00\x00\x00\x00\x00"
+
 def test_aligned():
     common(Aligned(4, Byte), b"\x01\x00\x00\x00", 1, 4)
     common(Struct("a"/Aligned(4, Byte), "b"/Byte), b"\x01\x00\x00\x00\x02", Container(a=1)(b=2), 5)
@@ -828,10 +977,17 @@ def test_aligned():
     assert Aligned(4, Int16ub).build(1) == b"\x00\x01\x00\x00"
     assert Aligned(4, Int32ub).build(1) == b"\x00\x00\x00\x01"
     assert Aligned(4, Int64ub).build(1) == b"\x00\x00\x00\x00\x00\x00\x00\x01"
+    assert Aligned(4, Sequence(Byte, Byte, Byte)).build([1]) == b"\x01\x00\x00\x00"
     d = Aligned(this.m, Byte)
     common(d, b"\xff\x00", 255, 2, m=2)
     assert raises(d.sizeof) == SizeofError
     assert raises(d.sizeof, m=2) == 2
+    d = Aligned(4, VarInt)
+    common(d, b"\x80\x01\x00\x00", 128, SizeofError)
+    d = Aligned(4, Int16ub, pattern=b"?")
+    assert d.build(1) == b"\x00\x01??"
+    assert d.parse_stream(pipestream(b"\x00\x01??")) == 1
+    assert d.parse_stream(devzero) == 0
 
 def test_alignedstruct():
     d = AlignedStruct(4, "a"/Int8ub, "b"/Int16ub)
@@ -862,9 +1018,16 @@ def test_peek():
     assert d.sizeof() == 0
     d = Peek(VarInt)
     assert d.sizeof() == 0
+    d = Struct("a"/Peek(Int16ub), "b"/Byte)
+    assert d.parse(b"\x01") == Container(a=None)(b=1)
+    assert d.parse(b"\x01\x02") == Container(a=0x0102)(b=1)
 
     d = Struct("a"/Peek(Int8ub), "b"/Int16ub)
     common(d, b"\x01\x02", Container(a=0x01)(b=0x0102), 2)
+    stream = io.BytesIO(b"\x01\x02")
+    assert Peek(Struct("x"/Byte, "y"/Byte)).parse_stream(stream)._io is stream
+    d = Struct(Bytes(1), "p"/Peek(Struct("pos"/Tell, "x"/Byte)), "y"/Byte)
+    assert d.parse(b"\x01\x02") == Container(p=Container(pos=1)(x=2))(y=2)
     d = Struct(Peek("a"/Byte), Peek("b"/Int16ub))
     d.parse(b"\x01\x02") == Container(a=0x01)(b=0x0102)
     d.build(Container(a=0x01)(b=0x0102)) == b"\x01\x02"
@@ -936,6 +1099,18 @@ def test_byteswapped():
     d = ByteSwapped(Struct("a"/Byte, "b"/Byte))
     common(d, b"\x01\x02", Container(a=2)(b=1), 2)
 
+def test_byteswapped_numeric():
+    d = ByteSwapped(Int32ub)
+    assert type(d) is FormatField
+    common(d, b"\x01\x00\x00\x00", 1, 4)
+    common(ByteSwapped(Int16sl), b"\xff\xfe", -2, 2)
+    common(ByteSwapped(Int32un), Int32un.build(1)[::-1], 1, 4)
+    common(ByteSwapped(Float32b), Float32l.build(1.5), 1.5, 4)
+    d = ByteSwapped(Int24ub)
+    assert type(d) is BytesInteger
+    common(d, b"\x01\x00\x00", 1, 3)
+    common(ByteSwapped(Int24sl), b"\xff\xff\xfe", -2, 3)
+
 def test_byteswapped_from_issue_70():
     d = ByteSwapped(BitStruct("flag1"/Bit, "flag2"/Bit, Padding(2), "number"/BitsInteger(16), Padding(4)))
     assert d.parse(b'\xd0\xbc\xfa') == Container(flag1=1)(flag2=1)(number=0xabcd)
@@ -962,6 +1137,8 @@ def test_prefixed():
     d = Prefixed(VarInt, GreedyBytes)
     assert d.parse(b"\x03abc??????") == b"abc"
     assert d.build(b"abc") == b'\x03abc'
+    assert d.build(bytearray(b"abc")) == b'\x03abc'
+    assert raises(d.build, u"abc") == StringError
     assert raises(d.sizeof) == SizeofError
     d = Prefixed(Byte, Sequence(Peek(Byte), Int16ub, GreedyBytes))
     assert d.parse(b"\x02\x00\xff????????") == [0,255,b'']
@@ -991,6 +1168,13 @@ def test_fixedsized():
     common(d, bytes(10), bytes(10), 10)
     d = FixedSized(10, GreedyString("utf-8"))
     common(d, bytes(10), u"\x00"*10, 10)
+    d = FixedSized(4, GreedyBytes)
+    assert d.build(b"ab") == b"ab\x00\x00"
+    assert d.build(bytearray(b"abcd")) == b"abcd"
+    assert raises(d.build, b"abcde") == PaddingError
+    assert raises(d.build, u"ab") == StringError
+    d = FixedSized(4, NullStripped(GreedyBytes))
+    assert d.build(b"ab") == b"ab\x00\x00"
 
 def test_nullterminated():
     d = NullTerminated(Byte)
@@ -1014,6 +1198,28 @@ def test_nullterminated():
     d = NullTerminated(GreedyBytes, term=bytes(2))
     common(d, b"\x01\x00\x00\x02\x00\x00", b"\x01\x00\x00\x02", SizeofError)
 
+def test_nullterminated_longdata():
+    d = NullTerminated(GreedyBytes) >> GreedyBytes
+    assert d.parse(b"\x01"*1000 + b"\x00\x02") == [b"\x01"*1000, b"\x02"]
+    d = NullTerminated(GreedyBytes, consume=False) >> GreedyBytes
+    assert d.parse(b"\x01"*1000 + b"\x00\x02") == [b"\x01"*1000, b"\x00\x02"]
+    d = NullTerminated(GreedyBytes, term=bytes(2)) >> GreedyBytes
+    assert d.parse(b"\x01"*99 + b"\x00"*3 + b"\x02") == [b"\x01"*99 + b"\x00", b"\x02"]
+    d = NullTerminated(GreedyBytes, term=bytes(2), require=False) >> GreedyBytes
+    assert d.parse(b"\x01"*201) == [b"\x01"*200, b""]
+    assert raises(NullTerminated(GreedyBytes, term=bytes(2)).parse, b"\x01"*201) == StreamError
+
+def test_nullterminated_bufferedstream():
+    d = NullTerminated(GreedyBytes) >> GreedyBytes
+    stream = io.BufferedReader(io.BytesIO(b"\x01"*1000 + b"\x00\x02"), buffer_size=64)
+    assert d.parse_stream(stream) == [b"\x01"*1000, b"\x02"]
+    d = NullTerminated(GreedyBytes, include=True, consume=False) >> GreedyBytes
+    stream = io.BufferedReader(io.BytesIO(b"\x01"*1000 + b"\x00\x02"), buffer_size=64)
+    assert d.parse_stream(stream) == [b"\x01"*1000 + b"\x00", b"\x00\x02"]
+    d = NullTerminated(GreedyBytes, term=bytes(2), require=False)
+    stream = io.BufferedReader(io.BytesIO(b"\x01"*201), buffer_size=64)
+    assert d.parse_stream(stream) == b"\x01"*200
+
 def test_nullstripped():
     d = NullStripped(GreedyBytes)
     common(d, b'\xff', b'\xff', SizeofError)
@@ -1029,6 +1235,12 @@ def test_nullstripped():
     d = NullStripped(GreedyBytes, pad=bytes(2))
     assert d.parse(bytes(10)) == b""
     assert d.parse(bytes(11)) == b""
+    assert d.parse(b"\x01\x00\x00\x00\x00") == b"\x01\x00"
+    assert d.parse(b"\x00\x01\x00\x00\x00") == b"\x00\x01"
+    assert d.parse(b"\x00\x00\x00\x01") == b"\x00\x00\x00\x01"
+    assert d.parse(b"\x01\x00\x01") == b"\x01\x00\x01"
+    d = NullStripped(GreedyBytes, pad=b"\x01\x00")
+    assert d.parse(b"\x05\x00\x01\x00\x01") == b"\x05\x00"
 
 def test_restreamdata():
     d = RestreamData(b"\x01", Int8ub)
@@ -1210,6 +1422,10 @@ def test_compressed_zlib():
     assert d.parse(d.build(zeros)) == zeros
     assert len(d.build(zeros)) < 50
     assert raises(d.sizeof) == SizeofError
+    assert d.parse(d.build(bytearray(zeros))) == zeros
+    assert raises(d.build, u"zeros") == StringError
+    d = Compressed(Bytes(2), "zlib")
+    assert d.parse(d.build(b"ab")) == b"ab"
 
 def test_compressed_gzip():
     zeros = bytes(10000)
@@ -1251,6 +1467,26 @@ def test_compressed_prefixed():
     st = Struct("one"/d, "two"/d)
     assert st.parse(st.build(Container(one=zeros,two=zeros))) == Container(one=zeros,two=zeros)
     assert raises(d.sizeof) == SizeofError
+    d = Prefixed(Byte, Compressed(CString("utf8"), "zlib"))
+    assert d.parse(d.build(u"Афон")) == u"Афон"
+    assert d.build(u"Афон") == Prefixed(Byte, GreedyBytes).build(Compressed(CString("utf8"), "zlib").build(u"Афон"))
+    calls = []
+    d = Prefixed(Byte, Compressed(Int32ub, "zlib") * (lambda obj,ctx: calls.append(obj)))
+    assert d.parse(d.build(255)) == 255
+    assert calls == [255]
+
+    class Reversed(Tunnel):
+        def _parse(self, stream, context, path):
+            return super()._parse(stream, context, path)[::-1]
+        def _build(self, obj, stream, context, path):
+            return super()._build(obj[::-1], stream, context, path)
+        def _decode(self, data, context, path):
+            return data
+        def _encode(self, data, context, path):
+            return data
+    d = Prefixed(Byte, Reversed(GreedyBytes))
+    assert d.build(b"abc") == b"\x03cba"
+    assert d.parse(b"\x03cba") == b"abc"
 
 def test_rebuffered():
     data = b"0" * 1000
@@ -1299,6 +1535,16 @@ def test_lazystruct():
     assert d.build(Container(obj)) == b"\x00\x00\x01\x00\x02\x00\x01\x00"
     assert raises(d.sizeof) == SizeofError
 
+def test_lazystruct_staticsizes():
+    d = LazyStruct("a"/Int16ub, "b"/Bytes(2), "s"/PascalString(Byte, "ascii"), "c"/Int8ub, "d"/Byte[2])
+    d = Sequence(d, GreedyBytes)
+    obj = d.parse(b"\x00\x01xy\x02ab\x03\x04\x05rest")
+    assert obj[1] == b"rest"
+    assert obj[0].s == "ab"
+    assert obj[0].d == [4,5]
+    assert obj[0].c == 3
+    assert obj[0].a == 1
+
 def test_lazyarray():
     d = LazyArray(5, Int8ub)
     obj = d.parse(b"\x00\x01\x02\x03\x04")
@@ -1334,9 +1580,26 @@ def test_lazyarray():
     assert d.build(obj[:]) == b"\x00\x01\x02\x03\x04"
     assert raises(d.sizeof) == SizeofError
 
+    d = Struct("array" / LazyArray(3, Int16ub), "tail" / Byte)
+    obj = d.parse(b"\x00\x01\x00\x02\x00\x03\xff")
+    assert obj.tail == 255
+    assert obj.array[2] == 3
+    assert obj.array == [1,2,3]
+
 def test_lazybound():
     d = LazyBound(lambda: Byte)
-    common(d, b"\x01", 1)
+    common(d, b"\x01", 1, 1)
+    d = LazyBound(lambda: Struct("a"/Int16ub, "b"/Byte))
+    assert d.sizeof() == 3
+    d = LazyBound(lambda: Bytes(this.n))
+    assert d.sizeof(n=4) == 4
+    assert raises(d.sizeof) == SizeofError
+
+    calls = []
+    d = LazyBound(lambda: calls.append(1) or Byte)
+    assert d.parse(b"\x01") == 1
+    assert d.build(1) == b"\x01"
+    assert len(calls) == 1
 
     d = Struct(
         "value" / Byte,
@@ -1344,6 +1607,12 @@ def test_lazybound():
     )
     common(d, b"\x05\x09\x00", Container(value=5)(next=Container(value=9)(next=Container(value=0)(next=None))))
 
+    d = Struct(
+        "kind" / Byte,
+        "child" / Prefixed(Byte, LazyBound(lambda: d)),
+    )
+    assert raises(d.sizeof) == SizeofError
+
     d = Struct(
         "value" / Byte,
         "next" / GreedyBytes,
@@ -1443,6 +1712,7 @@ def test_repr():
 def test_operators():
     common(Struct("new" / ("old" / Byte)), b"\x01", Container(new=1), 1)
     common(Struct(Renamed(Renamed(Byte, newname="old"), newname="new")), b"\x01", Container(new=1), 1)
+    assert ("num" / Byte * "docs").subcon is Byte
 
     common(Array(4, Byte), b"\x01\x02\x03\x04", [1,2,3,4], 4)
     common(Byte[4], b"\x01\x02\x03\x04", [1,2,3,4], 4)
@@ -1725,6 +1995,14 @@ def test_pickling_constructs():
     du = pickle.loads(pickle.dumps(d, protocol=-1))
     assert du.parse(data) == d.parse(data)
 
+def test_copying_constructs():
+    import copy
+    d = Struct("a" / Int16ub, "b" / Byte[2])
+    d2 = copy.copy(d)
+    assert d2 is not d
+    assert d2.subcons is d.subcons
+    assert d2.parse(b"\x00\x01\x02\x03") == d.parse(b"\x00\x01\x02\x03")
+
 def test_exposing_members_attributes():
     d = Struct(
         "animal" / Enum(Byte, giraffe=1),
@@ -1933,6 +2211,27 @@ def test_struct_root_topmost():
     # d.parse(b'', z=2)
     assert d.parse(b"", z=2) == Container(x=1, inner=Container(inner2=Container(x=1,z=2,zz=2)))
 
+def test_parsedhook_nestedrenamed():
+    outputs = []
+    def printobj(obj, ctx):
+        outputs.append(obj)
+    d = Struct("a" / Byte * printobj * "docs")
+    assert d.parse(b"\x01") == Container(a=1)
+    assert outputs == [1]
+
+def test_parsedhook_nestedrenamedhooks():
+    outputs = []
+    d = Struct("a" / Byte * (lambda obj,ctx: outputs.append(("inner",obj))) * (lambda obj,ctx: outputs.append(("outer",obj))))
+    assert d.parse(b"\x01") == Container(a=1)
+    assert outputs == [("inner",1), ("outer",1)]
+
+def test_renamed_nestednames():
+    d = "new" / ("old" / Byte)
+    assert raises(d.parse, b"") == StreamError
+    with pytest.raises(StreamError, match="-> new -> old"):
+        d.parse(b"")
+    assert d.parse(b"\x01") == 1
+
 def test_parsedhook_repeatersdiscard():
     outputs = []
     def printobj(obj, ctx):